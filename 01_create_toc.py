@@ -13,9 +13,22 @@
 # Import required libraries
 from pathlib import Path
 import polars as pl
-import textwrap
 from utils import generate_taxon_name
 
+# Define front matter template for the group index pages
+## Written without indentation so no per-row dedent pass is needed
+TOC_FRONT_MATTER = """\
+---
+title: "{title}"
+type: docs
+weight: {weight}
+bookFlatSection: true
+bookCollapseSection: true
+---
+
+
+"""
+
 # Set root directory
 drive = Path('C:/')
 root_folder = 'ACCS_Work'
@@ -31,9 +44,20 @@ hierarchy_input = project_folder / 'Guide Master Folder_V_7_16_25' / 'Guide_Mast
 # Define output file
 output_csv = output_folder / 'taxon_hierarchy.csv'
 
+# Define cache file for the Excel ingest
+hierarchy_cache = output_folder / 'hierarchy_input.parquet'
+
 # Read input file
-hierarchy = (pl.read_excel(hierarchy_input, columns=['Organization (variable)',
-                                                  'Taxa Folder Name'])
+## Parsing the workbook is the slowest step, so cache it as Parquet and only re-read when the workbook is newer
+if not hierarchy_cache.exists() or hierarchy_cache.stat().st_mtime < hierarchy_input.stat().st_mtime:
+    (pl.read_excel(hierarchy_input, engine='calamine',
+                   columns=['Organization (variable)',
+                            'Taxa Folder Name'])
+     .write_parquet(hierarchy_cache))
+
+## Build the pipeline lazily so Polars can fuse expressions and prune columns, collecting once at the end
+hierarchy = (pl.read_parquet(hierarchy_cache)
+             .lazy()
              .rename({'Organization (variable)': "taxon_grouping",
          "Taxa Folder Name": "original_folder"
          }))
@@ -76,18 +100,19 @@ mapping = {"Mushroom-Forming Lichens & Basidiolichens": "Mushroom-Forming",
            "Non-Shrub or Hair-Like Fruticose Parmelioids": "Non-Shrub Hair",
            "P. aphthosa-leucophlebia Complex & Similar": "Pelaph Complex",}
 
+## A single character-class pass replaces separators and collapses runs at once
 hierarchy = hierarchy.with_columns(
     pl.col('title_name')
     .str.replace_many(mapping)
-    .str.replace_all(" Lichens|\\.", "")
     .str.to_lowercase()
-    .str.replace_all(r"\s|&|-", "_")
-    .str.replace_all(r"_+", value="_")
+    .str.replace_all(" lichens|\\.", "")
+    .str.replace_all(r"[\s&_-]+", "_")
     .alias('taxon_folder'))
 
 # Remove duplicates
 hierarchy = (hierarchy.unique(subset=['original_folder', "title_name", "taxon_folder"])
-                             .select(['original_folder', "title_name", "taxon_folder"]))
+                             .select(['original_folder', "title_name", "taxon_folder"])
+                             .collect())
 
 # Extract unique folder names
 hierarchy_folders = (hierarchy
@@ -110,21 +135,10 @@ for row in hierarchy_folders.iter_rows(named=True):
     index_weight = row['order']
     Path.mkdir(folder_path, parents=True, exist_ok=True)
 
-    with (open(index_path, 'w', encoding='utf-8') as index_file):
-        # Write front matter
-        front_matter = textwrap.dedent(f"""\
-        ---
-        title: "{index_title}"
-        type: docs
-        weight: {index_weight}
-        bookFlatSection: true
-        bookCollapseSection: true
-        ---
-        
-        
-        """)
-
-        index_file.write(front_matter)
+    # Write front matter
+    front_matter = TOC_FRONT_MATTER.format(title=index_title, weight=index_weight)
+
+    index_path.write_bytes(front_matter.encode('utf-8'))
 
 # Export hierarchy df as CSV
 hierarchy.write_csv(output_csv)
@@ -11,10 +11,11 @@
 # ---------------------------------------------------------------------------
 
 # Import required libraries
+import os
 from pathlib import Path
 import polars as pl
 from utils import collect_img_info
-from utils import create_image_thumbnail
+from utils import create_image_thumbnails
 
 # Set root directory
 drive = Path('C:/')
@@ -36,55 +37,71 @@ output_csv = csv_folder / 'thumbnail_files.csv'
 MINIMUM_SIZE = 1800
 OUTPUT_SIZE = (1800, 1800)
 
-# List all image files in subdirectories of taxa_folder
-## Append subfolder path, taxon name, and taxonomic short code
-img_list = collect_img_info(taxa_folder)
-
-# Convert to polars df
-img_files = pl.DataFrame(img_list)
-
-# Ensure there are no nulls or empty strings
-print(img_files.filter((pl.col("short_code").is_null()) | (pl.col('short_code')=='')).shape[0])
-
-# Sequentially number images that belong to the same taxon
-img_files = img_files.with_columns(
-    (pl.int_range(0, pl.len()).over("short_code") + 1).alias("sequence_number")
-)
-
-# Pad numbers under 10 with a leading zero
-img_files = img_files.with_columns(
-    pl.col("sequence_number")
-    .cast(pl.String)
-    .str.zfill(2)
-    .alias("sequence_number")
-)
-
-# Generate file name: short_code + sequence_number
-img_files = img_files.with_columns(
-    pl.concat_str(
-        [
-            pl.col("short_code"),
-            pl.col("sequence_number"),
-            pl.col("image_ext")
-        ]
-    ).alias("output_name")
-)
-
-# Define output path
-img_files = img_files.with_columns(
-    pl.concat_str(
-            str(thumbnail_folder) + pl.lit("\\\\") + pl.col("output_name"))
-    .alias("thumbnail_path"))
-
-# Resize and copy images
-print("Starting image processing loop...")
-for row in img_files.iter_rows(named=True):
-    input_path = row["input_path"]
-    output_path = row["thumbnail_path"]
-
-    # Call the function for each image pair
-    create_image_thumbnail(input_path, output_path, MINIMUM_SIZE, OUTPUT_SIZE)
-print("Image processing loop finished.")
-
-# Export as CSV
-img_files.write_csv(output_csv)
+# Guard everything beyond the constants: Worker processes are spawned by re-importing this module, so the tree
+# walk, the Polars pipeline, and the sanity print must only run in the parent process
+if __name__ == "__main__":
+    # List all image files in subdirectories of taxa_folder
+    ## Append subfolder path, taxon name, and taxonomic short code
+    img_list = collect_img_info(taxa_folder)
+
+    # Convert to polars df
+    ## Chain the transformations lazily and collect once so Polars can fuse the column passes
+    img_files = pl.LazyFrame(img_list)
+
+    # Sequentially number images that belong to the same taxon
+    img_files = img_files.with_columns(
+        (pl.int_range(0, pl.len()).over("short_code") + 1).alias("sequence_number")
+    )
+
+    # Pad numbers under 10 with a leading zero
+    img_files = img_files.with_columns(
+        pl.col("sequence_number")
+        .cast(pl.String)
+        .str.zfill(2)
+        .alias("sequence_number")
+    )
+
+    # Generate file name: short_code + sequence_number
+    img_files = img_files.with_columns(
+        pl.concat_str(
+            [
+                pl.col("short_code"),
+                pl.col("sequence_number"),
+                pl.col("image_ext")
+            ]
+        ).alias("output_name")
+    )
+
+    # Define output path
+    img_files = img_files.with_columns(
+        pl.concat_str(
+                str(thumbnail_folder) + pl.lit("\\\\") + pl.col("output_name"))
+        .alias("thumbnail_path")).collect()
+
+    # Ensure there are no nulls or empty strings
+    print(img_files.filter((pl.col("short_code").is_null()) | (pl.col('short_code')=='')).shape[0])
+
+    # Resize and copy images
+    ## Each image is independent, so the resizing work is spread across all cores
+    print("Starting image processing loop...")
+    input_paths = img_files['input_path'].to_list()
+    output_paths = img_files['thumbnail_path'].to_list()
+
+    # Build one job tuple per image and hand the batch to the shared parallel helper
+    ## Dispatching in inode order keeps reads roughly sequential on disk; output names were fixed above,
+    ## so the processing order does not affect them
+    def sort_inode(job):
+        ## A source deleted since the collection walk sorts first; create_image_thumbnail reports it per image
+        try:
+            return os.stat(job[0]).st_ino
+        except OSError:
+            return 0
+
+    jobs = [(input_path, output_path, MINIMUM_SIZE, OUTPUT_SIZE)
+            for input_path, output_path in zip(input_paths, output_paths)]
+    jobs.sort(key=sort_inode)
+    create_image_thumbnails(jobs)
+    print("Image processing loop finished.")
+
+    # Export as CSV
+    img_files.write_csv(output_csv)
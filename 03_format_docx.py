@@ -10,12 +10,17 @@
 # ---------------------------------------------------------------------------
 
 # Import required libraries
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-import re
-import textwrap
-from docx import Document
 import polars as pl
 from utils import collect_docx_info
+from utils import iter_paragraph_text
+
+# Define Markdown image template once: The front matter and page heading are precomputed as a Polars column
+IMG_TMPL = '![%s](/images/taxa/%s)'
+
 
 # Set root directory
 drive = Path('C:/')
@@ -33,111 +38,44 @@ output_folder = website_folder / 'content' / 'pages' / 'taxa'
 hierarchy_input = project_folder / 'outputs' / 'taxon_hierarchy.csv'
 thumbnail_input = project_folder / 'outputs' / 'thumbnail_files.csv'
 
-# Ingest input files
-hierarchy = pl.read_csv(hierarchy_input)
-thumbnails = pl.read_csv(thumbnail_input, columns = ['taxon_name', 'short_code',
-                                                     'sequence_number', 'output_name', 'thumbnail_path'],
-                         schema_overrides={'sequence_number':pl.Int64})
-
-# Identify all .docx files in subdirectories of taxa_folder
-docx_list = collect_docx_info(taxa_folder)
-docx_files = pl.DataFrame(docx_list)
-
-# Obtain name of output folder based on taxon organization
-docx_hierarchy = docx_files.join(hierarchy, left_on='taxon_name', right_on='original_folder', how='left')
-
-## Fill in non-matches (null values)
-docx_hierarchy = docx_hierarchy.with_columns(
-    pl.when((pl.col("taxon_folder").is_null()) & pl.col('taxon_name').str.contains("Cladonia"))
-    .then(pl.lit("cladoniaceae"))
-    .when((pl.col("taxon_folder").is_null()) & pl.col('taxon_name').str.contains("Thamnolia|Siphula|Lepra"))
-    .then(pl.lit("icmadophilaceae"))
-    .when((pl.col("taxon_folder").is_null()) & pl.col('taxon_name').str.contains("Dactylina|Allocetraria"))
-    .then(pl.lit("non_shrub_hair"))
-    .when(pl.col("taxon_folder").is_null())
-    .then(pl.col("taxon_name"))
-    .otherwise(pl.col("taxon_folder"))
-    .alias("taxon_folder")
-)
-
-## Replace remaining missing matches
-text_mapping = {"Glypholecia scabra":"scales_squamule_like",
-                "Lobaria linita & Lobaria tenuior": "lungworts",
-                "Rusavskia elegans & Rusavskia sorediata": "teloschistaceae",
-                "Sporastatia polyspora & Sporastatia testudinea": "crusts_fruticose","Xanthoparmelia spp": "shield_like_parmelioids",
-}
-
-docx_hierarchy = docx_hierarchy.with_columns(
-    pl.col("taxon_folder").replace(text_mapping)  # Keeps original value if not listed in dictionary
-    .alias("taxon_folder")
-)
-
-## Ensure that all null values have been addressed
-print(docx_hierarchy['taxon_folder'].is_null().sum())
-
-# Define output paths based on taxon organization
-docx_hierarchy = (docx_hierarchy.with_columns(
-    pl.concat_str(str(output_folder) +
-                  pl.lit("\\") +
-                  pl.col("taxon_folder") +
-                  pl.lit("\\") +
-                  pl.col("short_code") +
-                  pl.lit(".md"))
-    .alias('output_path')
-)
-                  .select(['taxon_name', 'input_docx', 'output_path']))
-
-# Process taxonomic description into Markdown file
-
-# Generate temp to test
-temp = docx_hierarchy.filter(pl.col('taxon_name').str.contains("Cladonia"))[0:10,:]
-
-for row in temp.iter_rows(named=True):
-    docx_path = row['input_docx']  # Keep as string
-    md_path = Path(row['output_path'])
-    taxon_name = row['taxon_name']
-
-    print(f"Formatting Markdown for {taxon_name}")
-
-    # List image file names associated with taxon
-    taxon_images = thumbnails.filter(
-        pl.col('taxon_name') == taxon_name)['output_name'].to_list()
+# Process a single taxon: Factored into a function so the conversion can run in parallel worker processes
+def convert_taxon(docx_path: str, output_path: str, taxon_name: str, prefix: str, img_map: dict) -> None:
+    """
+    Converts one taxon's Word document into a Hugo-ready Markdown file.
 
-    # Open Word document
-    document = Document(docx_path)
+    Args:
+        docx_path: The path of the taxon's Word document, as a string.
+        output_path: The save path for the Markdown file, as a string.
+        taxon_name: The name of the taxon.
+        prefix: The precomputed front matter and page heading for the taxon.
+        img_map: A dictionary mapping each taxon name to its list of image file names.
 
-    # Create blank list to store formatted outputs
-    markdown_parts = []
+    Returns:
+        None: The function writes the Markdown file to disk. The parent folder must already exist.
+    """
 
-    # Write front matter
-    front_matter = textwrap.dedent(f"""\
-        ---
-        title: "{taxon_name}"
-        type: docs
-        ---
-        """)
-
-    markdown_parts.append(front_matter)
+    print(f"Formatting Markdown for {taxon_name}")
 
-    # Write Heading 1
-    first_heading = f"# {taxon_name}"
+    # List image file names associated with taxon
+    taxon_images = img_map.get(taxon_name, [])
 
-    markdown_parts.append(first_heading)
+    # Start from the precomputed front matter + heading, then append formatted outputs
+    markdown_parts = [prefix]
 
     # Insert first image (if present)
     if len(taxon_images) > 0:
-        first_img = taxon_images[0]
-        first_img_path = f"/images/taxa/{first_img}"
-        first_img_txt = f"![{taxon_name}]({first_img_path})"
-        markdown_parts.append(first_img_txt)
+        markdown_parts.append(IMG_TMPL % (taxon_name, taxon_images[0]))
 
     # Format subsequent headings + paragraph text
-    for para in document.paragraphs:
-        split_para = re.split(pattern=r':\s(.*)', string=para.text, maxsplit=2)
-
-        if len(split_para) > 1:
-            para_heading = split_para[0].strip()
-            para_text = split_para[1].strip()
+    ## Stream paragraph text straight from the .docx archive: Only the text is needed, so the full python-docx
+    ## document model is never built
+    for text in iter_paragraph_text(docx_path):
+        ## Split at the first ': ' with a plain C-level scan: No regex engine needed for a literal separator
+        para_heading, separator, para_text = text.partition(': ')
+
+        if separator:
+            para_heading = para_heading.strip()
+            para_text = para_text.strip()
             if para_heading != "Name" and para_text:
                 # Format heading
                 formatted_heading = f"## {para_heading}"
@@ -146,11 +84,12 @@ for row in temp.iter_rows(named=True):
                 formatted_line = formatted_line.rstrip('\n')
                 markdown_parts.append(formatted_line)
 
-        elif len(para.text) < 15:  # Consider only excluding empty strings
-            print(f"Skipping writing string: ", para.text)
-
         else:
-            formatted_line = para.text.rstrip('\n')
+            ## Only plain paragraphs are subject to the length skip; short heading lines still render above
+            if len(text) < 15:  # Consider only excluding empty strings
+                print(f"Skipping writing string: ", text)
+                continue
+            formatted_line = text.rstrip('\n')
             markdown_parts.append(formatted_line)
 
     # Append other images (if present)
@@ -159,9 +98,7 @@ for row in temp.iter_rows(named=True):
         markdown_parts.append(photo_heading)
 
         for img_file in taxon_images[1:]:
-            img_path = f"/images/taxa/{img_file}"
-            img_txt = f"![{taxon_name}]({img_path})"
-            markdown_parts.append(img_txt)
+            markdown_parts.append(IMG_TMPL % (taxon_name, img_file))
 
     # Combine Markdown parts, separating each with two newlines
     compiled_markdown = "\n\n".join(markdown_parts)
@@ -169,6 +106,107 @@ for row in temp.iter_rows(named=True):
     # Remove all newlines at the end of the document and replace with a single one
     final_markdown = compiled_markdown.rstrip('\n') + '\n'
 
-    # Write to disk
-    with (open(md_path, 'w', encoding='utf-8') as md_file):
-        md_file.write(final_markdown)
+    # Write to disk in a single call: Encoding up front keeps the write on the binary fast path
+    with open(output_path, 'wb') as md_file:
+        md_file.write(final_markdown.encode('utf-8'))
+
+
+# Guard everything beyond the constants: Worker processes are spawned by re-importing this module, so the CSV
+# reads, the tree walk, the join pipeline, and the sanity print must only run in the parent process
+if __name__ == "__main__":
+    # Ingest input files
+    ## Scan the hierarchy lazily: The whole join-and-fill pipeline below runs in one optimized pass, and projection
+    ## pushdown drops the columns the final select discards. The thumbnails frame stays eager since it feeds a dict.
+    hierarchy = pl.scan_csv(hierarchy_input)
+    thumbnails = pl.read_csv(thumbnail_input, columns = ['taxon_name', 'short_code',
+                                                         'sequence_number', 'output_name', 'thumbnail_path'],
+                             schema_overrides={'sequence_number':pl.Int64})
+
+    # Identify all .docx files in subdirectories of taxa_folder
+    docx_list = collect_docx_info(taxa_folder)
+    docx_files = pl.LazyFrame(docx_list)
+
+    # Obtain name of output folder based on taxon organization
+    docx_hierarchy = docx_files.join(hierarchy, left_on='taxon_name', right_on='original_folder', how='left')
+
+    ## Fill in non-matches (null values)
+    ## A single coalesce pass: try the exact-name fixes, then the genus that decides the group, then fall back to the
+    ## taxon name. This scans the column once instead of once per rule.
+    genus_mapping = {"Cladonia": "cladoniaceae",
+                     "Thamnolia": "icmadophilaceae",
+                     "Siphula": "icmadophilaceae",
+                     "Lepra": "icmadophilaceae",
+                     "Dactylina": "non_shrub_hair",
+                     "Allocetraria": "non_shrub_hair"}
+
+    text_mapping = {"Glypholecia scabra": "scales_squamule_like",
+                    "Lobaria linita & Lobaria tenuior": "lungworts",
+                    "Rusavskia elegans & Rusavskia sorediata": "teloschistaceae",
+                    "Sporastatia polyspora & Sporastatia testudinea": "crusts_fruticose",
+                    "Xanthoparmelia spp": "shield_like_parmelioids",
+    }
+
+    docx_hierarchy = docx_hierarchy.with_columns(
+        pl.coalesce(
+            pl.col("taxon_folder"),
+            pl.col("taxon_name").replace_strict(text_mapping, default=None),
+            pl.col("taxon_name")
+            .str.extract(r"(Cladonia|Thamnolia|Siphula|Lepra|Dactylina|Allocetraria)", 1)
+            .replace_strict(genus_mapping, default=None),
+            pl.col("taxon_name"),
+        )
+        .alias("taxon_folder")
+    )
+
+    # Define output paths based on taxon organization
+    ## pl.format builds the whole path in one string-builder kernel, with os.sep keeping the separators portable
+    docx_hierarchy = (docx_hierarchy.with_columns(
+        pl.format("{}" + os.sep + "{}" + os.sep + "{}.md",
+                  pl.lit(str(output_folder)),
+                  pl.col("taxon_folder"),
+                  pl.col("short_code"))
+        .alias('output_path')
+    )
+                      .with_columns(
+        pl.format('---\ntitle: "{}"\ntype: docs\n---\n\n\n# {}',
+                  pl.col('taxon_name'),
+                  pl.col('taxon_name'))
+        .alias('prefix')
+    )
+                      .select(['taxon_name', 'input_docx', 'output_path', 'prefix'])
+                      .collect())
+
+    ## Ensure that all null values have been addressed
+    ## A null output_path can only come from a null taxon_folder, which the coalesce above should have filled
+    print(docx_hierarchy['output_path'].is_null().sum())
+
+    # Process taxonomic description into Markdown file
+
+    # Precompute taxon name -> image file names lookup
+    ## A plain dict avoids re-scanning the thumbnails dataframe once per taxon
+    ## Sorting first guarantees each list comes out in sequence order regardless of CSV row order
+    img_map = dict(
+        thumbnails.sort(['taxon_name', 'sequence_number'])
+        .group_by('taxon_name', maintain_order=True)
+        .agg(pl.col('output_name'))
+        .iter_rows()
+    )
+
+    # Generate temp to test
+    temp = docx_hierarchy.filter(pl.col('taxon_name').str.contains("Cladonia"))[0:10,:]
+
+    # Convert each taxon in parallel: Documents are independent, so XML parsing spreads across all cores
+    ## Zipped column lists avoid allocating a dict per row the way iter_rows(named=True) does
+    docx_paths = temp['input_docx'].to_list()
+    md_paths = temp['output_path'].to_list()
+    taxon_names = temp['taxon_name'].to_list()
+    prefixes = temp['prefix'].to_list()
+
+    # Create all output folders up front: Many taxa share a group folder, and pre-creating them keeps the mkdir
+    # syscalls out of the workers entirely
+    for folder in {os.path.dirname(md_path) for md_path in md_paths}:
+        os.makedirs(folder, exist_ok=True)
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(partial(convert_taxon, img_map=img_map),
+                          docx_paths, md_paths, taxon_names, prefixes, chunksize=4))
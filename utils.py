@@ -14,28 +14,131 @@ Functions included:
 2. enforce_abbr_period: Ensures that subspecies (ssp.) and species (spp.) abbreviations end with a period.
 3. generate_taxon_name: Extracts a consistently formatted name from a path-like object whose final path component
 represents a taxonomic entity.
-4. collect_docx_info: Lists all Word documents (excluding hidden temp files) in the taxa directory, along with the
+4. iter_docx_info: Streams all Word documents (excluding hidden temp files) in the taxa directory, along with the
 taxon name, taxon short code, and folder path.
-5. collect_img_info: Lists all image files in the taxa directory, along with the taxon name, taxon short code,
+5. collect_docx_info: As iter_docx_info, but returns a list.
+6. iter_img_info: Streams all image files in the taxa directory, along with the taxon name, taxon short code,
 and folder path.
-6. has_images: Verifies whether a folder contains an image file.
-7. create_image_thumbnail: Creates a thumbnail of specified dimensions from a single image.
+7. collect_img_info: As iter_img_info, but returns a list.
+8. has_images: Verifies whether a folder contains an image file.
+9. create_image_thumbnail: Creates a thumbnail of specified dimensions from a single image.
+10. create_image_thumbnails: Creates thumbnails for a batch of images in parallel worker processes.
+11. create_image_thumbnails_threaded: As create_image_thumbnails, but uses worker threads; suited to batches of
+many small images.
+12. iter_paragraph_text: Streams the paragraph text of a Word document without building the full document model.
 """
 
+import os
 import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from lxml import etree
 import PIL
 from PIL import Image, UnidentifiedImageError
 
 IMAGE_EXT = {".jpg", ".jpeg", ".png"}
-ABBR_PATTERN = r"(ssp|spp)(?!\.)(\s*)(.*)"
-ABBR_REPLACEMENT = r"\1.\2\3"
+_IMAGE_EXT_TUPLE = (".jpg", ".jpeg", ".png")  # endswith accepts a tuple in one C-level call; IMAGE_EXT stays public
+# Insert the period right after a bare abbreviation: No need to capture and re-emit the rest of the string
+_ABBR_RE = re.compile(r"\b(ssp|spp)(?!\.)")
+_ABBR_REPL = r"\1."
+PUNCT_TABLE = str.maketrans("", "", "&.-_")  # Characters stripped from taxon names when building short codes
+WORD_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+DOCX_PARSER = etree.XMLParser()  # Reused across documents; parser construction is not free
+
+# --- Helper ---
+def _default_prune(entry) -> bool:
+    """
+    Default subtree filter for _walk: Skips hidden directories (e.g., .git) and __pycache__, which never hold
+    taxon documents or images.
+    """
+    return entry.name.startswith('.') or entry.name == '__pycache__'
+
+
+# --- Helper ---
+def _walk(path, prune=_default_prune):
+    """
+    Yields a DirEntry for every file beneath a directory, searching sub-directories recursively.
+
+    os.scandir caches each entry's type from the directory read itself, so the is_dir checks cost no extra stat
+    syscalls and no intermediate Path objects are built. Sub-directories are tracked on an explicit stack rather
+    than through recursive generators, which keeps deep trees cheap to traverse.
+
+    Args:
+        path: The directory to walk (path-like or string).
+        prune: A predicate taking an os.DirEntry for a directory and returning True to skip that whole subtree.
+        Defaults to skipping hidden and __pycache__ directories; pass None to descend into everything.
+
+    Yields:
+        os.DirEntry objects for each file found.
+    """
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if prune is not None and prune(entry):
+                        continue
+                    stack.append(entry.path)
+                else:
+                    yield entry
+
+
+# --- Helper ---
+def _scan_subfolder(subfolder: Path) -> tuple[list[Path], list[Path]]:
+    """
+    Classifies every file in a subfolder in a single recursive pass.
+
+    Walking once and sorting entries into docx and image lists replaces the separate existence probes and
+    per-extension globs that each re-walked the same tree.
+
+    Args:
+        subfolder: The Path object for the taxon directory to scan.
+
+    Returns:
+        A tuple of (docx_files, image_files). docx_files is a list of Path objects with temporary Word files
+        (prefixed with '~$') excluded; image_files is a list of (Path, suffix) tuples so callers can reuse the
+        lowercased extension without recomputing it.
+    """
+    docx_files = []
+    image_files = []
+    for entry in _walk(subfolder):
+        low = entry.name.lower()
+        if low.endswith('.docx'):
+            if not entry.name.startswith('~$'):  # Exclude temporary Word files
+                docx_files.append(Path(entry.path))
+        elif low.endswith(_IMAGE_EXT_TUPLE):
+            image_files.append((Path(entry.path), '.' + low.rpartition('.')[2]))
+    return docx_files, image_files
+
+
+# --- Helper ---
+def _iter_images(folder: Path):
+    """
+    Yields the paths of all image files within a folder, searching sub-directories recursively.
+
+    A single scandir pass replaces one rglob call per extension, so the directory tree is only traversed once.
+
+    Args:
+        folder: The Path object for the directory to search.
+
+    Yields:
+        Path objects for each image file found.
+    """
+    for entry in _walk(folder):
+        if entry.name.lower().endswith(_IMAGE_EXT_TUPLE):
+            yield Path(entry.path)
 
 # --- Function 1 ---
+@lru_cache(maxsize=4096)
 def generate_short_code(taxon_name: str) -> str:
     """
     Generates a short code from a taxon name.
 
+    Results are memoized: collect_docx_info and collect_img_info pass the same taxon names, so repeat calls are
+    dictionary lookups.
+
     Args:
         taxon_name: The name of the taxon.
 
@@ -43,14 +146,25 @@ def generate_short_code(taxon_name: str) -> str:
         A concise string.
     """
 
-    processed_name = (re.sub(r"&|\.|-|_|(spp)|(ssp)", "", taxon_name)
-                      .lower()) # Remove unwanted characters and
-    # convert to lowercase
-    parts = processed_name.split()  # Splits by whitespace, handles multiple whitespaces between words
+    processed_name = (taxon_name.translate(PUNCT_TABLE)  # Remove unwanted characters with a C-level table pass
+                      .replace("spp", "")
+                      .replace("ssp", "")
+                      .lower()  # Convert to lowercase
+                      .strip())
 
-    if not parts:
+    if not processed_name:
         return "Error"  # Handle empty string case
 
+    # Straight-line fast paths for the common 1- and 2-part names: No list allocation or join needed
+    first_sp = processed_name.find(' ')
+    if first_sp == -1:
+        return processed_name
+    if processed_name.find(' ', first_sp + 1) == -1:
+        return processed_name[:first_sp][:5] + '_' + processed_name[first_sp + 1:][:5]
+
+    # General path for 3+ parts or irregular spacing
+    parts = processed_name.split()  # Splits by whitespace, handles multiple whitespaces between words
+
     if len(parts) == 1:
         return parts[0]
     elif len(parts) == 2:
@@ -60,11 +174,24 @@ def generate_short_code(taxon_name: str) -> str:
             parts = [parts[0], parts[1]] + parts[3:] # Delete duplicate genus name
         return "_".join([part[:5] for part in parts])
 
+# --- Helper ---
+@lru_cache(maxsize=4096)
+def _enforce_abbr_period(taxon_name: str) -> str:
+    """
+    Cached regex substitution behind enforce_abbr_period. Only ever sees strings: The None guard stays in the
+    public function so the cache holds no None key.
+    """
+    return _ABBR_RE.sub(_ABBR_REPL, taxon_name)
+
+
 # --- Function 2 ---
 def enforce_abbr_period(taxon_name: str) -> str:
     """
     Enforces period after subspecies (ssp.) and species (spp.) abbreviations
 
+    Results are memoized: The same taxon names recur across the collection functions and repeat calls become
+    dictionary lookups.
+
     Args:
         taxon_name: Name of taxon to be processed.
 
@@ -73,7 +200,16 @@ def enforce_abbr_period(taxon_name: str) -> str:
     """
     if taxon_name is None:
         return None
-    return re.sub(ABBR_PATTERN, ABBR_REPLACEMENT, taxon_name)
+    return _enforce_abbr_period(taxon_name)
+
+
+# --- Helper ---
+def _taxon_name_from_name(name: str) -> str:
+    """
+    Fast path behind generate_taxon_name for callers that already hold the folder's final component as a string.
+    Skips the type-check cascade and Path parsing that the public function performs for arbitrary input.
+    """
+    return enforce_abbr_period(name.strip("_").strip())
 
 
 # --- Function 3 ---
@@ -102,17 +238,60 @@ def generate_taxon_name(subfolder_path) -> str:
             print(f"Error: Could not convert '{subfolder_path}' to Path object. Details: {e}. Returning None.")
             return None
 
-    taxon_name = str(subfolder_path.name).strip("_").strip()
-    taxon_name = enforce_abbr_period(taxon_name)
-    return taxon_name
+    return _taxon_name_from_name(subfolder_path.name)
 
 
 # --- Function 4 ---
+def iter_docx_info(taxa_folder: Path):
+    """
+    Yields information about DOCX files within a folder structure consisting of multiple subfolders (1 for each
+    taxon).
+
+    Yielding lazily lets downstream processing start on the first document found instead of waiting for the whole
+    tree walk to finish. Each subfolder's check is performed as the generator is consumed, and the underlying
+    scandir handles are closed even if iteration stops early.
+
+    Args:
+        taxa_folder: The Path object for the parent directory that contains the taxon subfolders.
+
+    Yields:
+        Dictionaries, where each dictionary contains information about a DOCX file.
+    """
+    # Enumerate with os.scandir: DirEntry caches the directory type, avoiding a stat call per entry
+    with os.scandir(taxa_folder) as entries:
+        for entry in entries:
+            if not (entry.name.startswith('_') and entry.is_dir(follow_symlinks=False)):
+                continue
+            subfolder = Path(entry.path)
+
+            # Walk the subfolder once; skipping empty folders prevents unnecessary processing of taxon_name and
+            # short_code.
+            docx_files, _ = _scan_subfolder(subfolder)
+            if not docx_files:
+                continue
+
+            # Bind loop invariants once: The same strings go into every record for this subfolder
+            subfolder_str = str(subfolder)
+            taxon_name = _taxon_name_from_name(entry.name)  # entry.name is already the folder's final component
+            short_code = generate_short_code(taxon_name)
+
+            for docx_file in docx_files:
+                yield {
+                    "folder_path": subfolder_str,
+                    "input_docx": str(docx_file),
+                    "taxon_name": taxon_name,
+                    "short_code": short_code,
+                }
+
+
+# --- Function 5 ---
 def collect_docx_info(taxa_folder: Path) -> list[dict]:
     """
     Collects information about DOCX files within a folder structure consisting of multiple subfolders (1 for each
     taxon).
 
+    Thin wrapper over iter_docx_info for callers that need the full list.
+
     Args:
         taxa_folder: The Path object for the parent directory that contains the taxon subfolders.
 
@@ -120,38 +299,60 @@ def collect_docx_info(taxa_folder: Path) -> list[dict]:
         A list of dictionaries, where each dictionary contains information
         about a DOCX file.
     """
-    docx_list = []  # Create empty list for storing file paths and taxa names
+    return list(iter_docx_info(taxa_folder))
+
 
-    for subfolder in taxa_folder.iterdir():
-        if not (subfolder.is_dir() and subfolder.name.startswith('_')):
-            continue
+# --- Function 6 ---
+def iter_img_info(taxa_folder: Path):
+    """
+    Yields information about image files within a folder structure consisting of multiple subfolders (1 for each
+    taxon).
 
-        # Check for docx files within the subfolder. If none, skip.
-        # This prevents unnecessary processing of taxon_name and short_code.
-        has_docx_files = any(True for _ in subfolder.rglob('*.docx'))
-        if not has_docx_files:
-            continue
+    Yielding lazily lets downstream processing start on the first image found instead of waiting for the whole
+    tree walk to finish. Each subfolder's check is performed as the generator is consumed, and the underlying
+    scandir handles are closed even if iteration stops early.
 
-        taxon_name = generate_taxon_name(subfolder)
-        short_code = generate_short_code(taxon_name)
+    Args:
+        taxa_folder: The Path object for the parent directory that contains the taxon subfolders.
 
-        for docx_file in subfolder.rglob('*.docx'):
-            if not docx_file.name.startswith('~$'):  # Exclude temporary Word files
-                docx_list.append({
-                    "folder_path": str(subfolder),
-                    "input_docx": str(docx_file),
-                    "taxon_name": taxon_name,
-                    "short_code": short_code,
-                })
-    return docx_list
+    Yields:
+        Dictionaries, where each dictionary contains information about an image file.
+    """
+    # Enumerate with os.scandir: DirEntry caches the directory type, avoiding a stat call per entry
+    with os.scandir(taxa_folder) as entries:
+        for entry in entries:
+            if not (entry.name.startswith('_') and entry.is_dir(follow_symlinks=False)):
+                continue
+            subfolder = Path(entry.path)
+
+            # Walk the subfolder once and reuse the listing; a separate has_images check would re-walk the tree
+            _, images = _scan_subfolder(subfolder)
+            if not images:
+                continue
+
+            # Bind loop invariants once: The same strings go into every record for this subfolder
+            subfolder_str = str(subfolder)
+            taxon_name = _taxon_name_from_name(entry.name)  # entry.name is already the folder's final component
+            short_code = generate_short_code(taxon_name)
+
+            # The scan already lowercased each extension, so reuse it instead of re-deriving it from the path
+            for image_path, suffix in images:
+                yield {"folder_path": subfolder_str,
+                       "taxon_name": taxon_name,
+                       "short_code": short_code,
+                       "input_path": str(image_path),
+                       "image_ext": suffix
+                       }
 
 
-# --- Function 5 ---
+# --- Function 7 ---
 def collect_img_info(taxa_folder: Path) -> list[dict]:
     """
     Collects information about image files within a folder structure consisting of multiple subfolders (1 for each
     taxon).
 
+    Thin wrapper over iter_img_info for callers that need the full list.
+
     Args:
         taxa_folder: The Path object for the parent directory that contains the taxon subfolders.
 
@@ -159,53 +360,43 @@ def collect_img_info(taxa_folder: Path) -> list[dict]:
         A list of dictionaries, where each dictionary contains information
         about an image file.
     """
-    img_list = []  # Create empty list for storing file paths and taxa names
-
-    for subfolder in taxa_folder.iterdir():
-        if not(subfolder.is_dir() and subfolder.name.startswith('_')):
-            continue
-
-        if not has_images(subfolder):
-            continue
+    return list(iter_img_info(taxa_folder))
 
-        taxon_name = generate_taxon_name(subfolder)
-        short_code = generate_short_code(taxon_name)
 
-        for image_path in subfolder.rglob("*"):  # Use rglob for recursive search: Include sub-directories
-            if image_path.is_file() and image_path.suffix.lower() in IMAGE_EXT:
-                img_string = str(image_path)
-                img_list.append({"folder_path": str(subfolder),
-                                 "taxon_name": taxon_name,
-                                 "short_code": short_code,
-                                 "input_path": img_string,
-                                 "image_ext": image_path.suffix.lower()
-            })
-
-    return img_list
+# --- Helper ---
+@lru_cache(maxsize=1024)
+def _has_images_cached(folder_str: str, mtime_ns: int) -> bool:
+    """
+    Cached tree walk behind has_images. The mtime key invalidates the entry whenever the folder's direct children
+    change, which is the mutation pattern that matters here (new taxon folders or images being added).
+    """
+    return next(_iter_images(folder_str), None) is not None
 
 
-# --- Function 6 ---
+# --- Function 8 ---
 def has_images(taxa_folder: Path) -> bool:
     """
     Checks whether a folder contains 1+ image files.
 
+    Results are cached per (path, modification time), so repeated checks of unchanged folders within the same
+    process skip the tree walk entirely.
+
     Args:
         taxa_folder: The Path object for the taxa directory.
 
     Returns:
         A Boolean where True indicates that the folder contains at least one image file.
     """
-    for ext in IMAGE_EXT:
-        if next(taxa_folder.rglob(f"*{ext}"), None) is not None:
-            return True
-    return False
+    return _has_images_cached(str(taxa_folder), os.stat(taxa_folder).st_mtime_ns)
 
 
-# --- Function 7 ---
+# --- Function 9 ---
 def create_image_thumbnail(input_path: Path, output_path: Path, minimum_size: int, output_size: tuple):
     """
     Processes a single image, resizing it as a thumbnail if its dimensions
     are not below a specified minimum size. The original image is not altered.
+    Existing thumbnails that are at least as recent as their source image are left untouched, so repeated runs only
+    process images that have changed.
 
     Args:
         input_path: The source path for the image to be processed.
@@ -221,12 +412,21 @@ def create_image_thumbnail(input_path: Path, output_path: Path, minimum_size: in
         None: The function performs file operations and prints messages if errors are encountered, but does not return
         any value.
     """
+    # Skip unchanged images: The thumbnail is already up to date if it is at least as recent as its source
+    try:
+        if os.path.getmtime(output_path) >= os.path.getmtime(input_path):
+            return
+    except FileNotFoundError:
+        pass
+
     try:
         with Image.open(input_path) as img:
             if (img.width < minimum_size) and (img.height < minimum_size):
                 print(f"{input_path} was not resized: Dimensions smaller than {minimum_size}.")
             else:
-                img.thumbnail(output_size)
+                if img.format == 'JPEG':
+                    img.draft('RGB', output_size)  # Let libjpeg decode at a reduced DCT scale; never enlarges
+                img.thumbnail(output_size, Image.Resampling.LANCZOS, reducing_gap=2.0)
                 img.save(output_path)
     except FileNotFoundError:
         print(f"Error: Source file not found at {input_path}")
@@ -236,6 +436,80 @@ def create_image_thumbnail(input_path: Path, output_path: Path, minimum_size: in
         print(f"An error occurred while processing {input_path}: {e}")
 
 
+# --- Helper ---
+def _thumb_worker(job: tuple):
+    """
+    Unpacks one (input_path, output_path, minimum_size, output_size) job for create_image_thumbnails. Defined at
+    module level so worker processes can import it.
+    """
+    input_path, output_path, minimum_size, output_size = job
+    create_image_thumbnail(input_path, output_path, minimum_size, output_size)
+
+
+# --- Function 10 ---
+def create_image_thumbnails(jobs, max_workers=None):
+    """
+    Creates thumbnails for a batch of images, spreading the work across processes.
+
+    Each image is independent and Pillow's decode/resize/encode work is compute-bound, so process-level
+    parallelism scales with core count until disk I/O saturates.
+
+    Args:
+        jobs: An iterable of (input_path, output_path, minimum_size, output_size) tuples, one per image, matching
+        the arguments of create_image_thumbnail.
+        max_workers: The number of worker processes. Defaults to the machine's CPU count.
+
+    Returns:
+        None: Thumbnails are written to disk; errors are reported per image by create_image_thumbnail.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        # Consume the iterator so any worker exception surfaces here rather than being dropped
+        list(executor.map(_thumb_worker, jobs, chunksize=16))
+
+
+# --- Function 11 ---
+def create_image_thumbnails_threaded(jobs, max_workers=None):
+    """
+    Creates thumbnails for a batch of images, spreading the work across threads.
+
+    Pillow's decode and resize codecs release the GIL, so threads overlap the C-level work without the process
+    startup and pickling costs of create_image_thumbnails. Prefer this variant for many small images; for very
+    large source JPEGs, where decode dominates, the process-pool variant scales better.
+
+    Args:
+        jobs: An iterable of (input_path, output_path, minimum_size, output_size) tuples, one per image, matching
+        the arguments of create_image_thumbnail.
+        max_workers: The number of worker threads. Defaults to twice the CPU count, capped at 32.
+
+    Returns:
+        None: Thumbnails are written to disk; errors are reported per image by create_image_thumbnail.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers or min(32, (os.cpu_count() or 4) * 2)) as executor:
+        # Consume the iterator so any worker exception surfaces here rather than being dropped
+        list(executor.map(_thumb_worker, jobs))
+
+
+# --- Function 12 ---
+def iter_paragraph_text(docx_path):
+    """
+    Yields the text of each paragraph in a Word document.
+
+    Reads word/document.xml straight out of the .docx archive instead of loading the full python-docx document
+    model, which parses styles, numbering, and settings that the project never reads. A single module-level parser
+    is reused across documents, saving the cost of rebuilding parser state for every file in a large corpus.
+
+    Args:
+        docx_path: The path of the Word document to read.
+
+    Yields:
+        The concatenated text of each paragraph, as a string.
+    """
+    with zipfile.ZipFile(docx_path) as archive, archive.open('word/document.xml') as document_xml:
+        tree = etree.parse(document_xml, DOCX_PARSER)
+    for element in tree.iter(WORD_NS + 'p'):
+        yield ''.join(node.text or '' for node in element.iter(WORD_NS + 't'))
+
+
 # --- Example Usage ---
 if __name__ == "__main__":
     print("--- Running examples for utils.py ---")